@@ -1,38 +1,48 @@
 # Configuration settings for NetWorthCalculator
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
+@lru_cache(maxsize=1)
+def _load_env() -> dict:
+    """Parse .env once per process and snapshot the environment"""
+    load_dotenv()
+    return os.environ.copy()
 
+
+_env = _load_env()
+
+
+@dataclass(frozen=True)
 class Settings:
     # Plaid API credentials (get these from https://dashboard.plaid.com)
-    PLAID_CLIENT_ID: str = os.getenv("PLAID_CLIENT_ID", "")
-    PLAID_SECRET: str = os.getenv("PLAID_SECRET", "")
+    PLAID_CLIENT_ID: str = _env.get("PLAID_CLIENT_ID", "")
+    PLAID_SECRET: str = _env.get("PLAID_SECRET", "")
 
     # Plaid environment: "sandbox", "development", or "production"
     # Use "sandbox" for testing with fake data
     # Use "development" for real accounts (free, requires approval)
-    PLAID_ENV: str = os.getenv("PLAID_ENV", "sandbox")
+    PLAID_ENV: str = _env.get("PLAID_ENV", "sandbox")
 
     # Plaid products to request
-    PLAID_PRODUCTS: list = ["transactions", "investments", "liabilities"]
+    PLAID_PRODUCTS: tuple = ("transactions", "investments", "liabilities")
 
     # Plaid country codes
-    PLAID_COUNTRY_CODES: list = ["US"]
+    PLAID_COUNTRY_CODES: tuple = ("US",)
 
     # Database path
-    DATABASE_PATH: str = os.getenv("DATABASE_PATH", "networth.db")
+    DATABASE_PATH: str = _env.get("DATABASE_PATH", "networth.db")
 
     # API settings
-    API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT: int = int(os.getenv("PORT", os.getenv("API_PORT", "8000")))
+    API_HOST: str = _env.get("API_HOST", "0.0.0.0")
+    API_PORT: int = int(_env.get("PORT", _env.get("API_PORT", "8000")))
 
     # Daily refresh time (24-hour format)
-    DAILY_REFRESH_HOUR: int = int(os.getenv("DAILY_REFRESH_HOUR", "6"))
-    DAILY_REFRESH_MINUTE: int = int(os.getenv("DAILY_REFRESH_MINUTE", "0"))
+    DAILY_REFRESH_HOUR: int = int(_env.get("DAILY_REFRESH_HOUR", "6"))
+    DAILY_REFRESH_MINUTE: int = int(_env.get("DAILY_REFRESH_MINUTE", "0"))
 
 
 settings = Settings()
@@ -44,3 +54,6 @@ PLAID_ENV_URLS = {
     "development": "https://development.plaid.com",
     "production": "https://production.plaid.com",
 }
+
+# Resolved once so hot paths don't re-index the dict
+PLAID_BASE_URL = PLAID_ENV_URLS[settings.PLAID_ENV]
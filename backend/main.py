@@ -1,22 +1,34 @@
 # FastAPI application for NetWorthCalculator
 
+import asyncio
+import fcntl
+import functools
+
+import numpy as np
+import orjson
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Optional
 from datetime import date, datetime
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import func, and_, case, desc, extract
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from config import settings
 from models import (
-    init_db, get_session, seed_default_categories,
-    Account, PlaidItem, Holding, Transaction, NetWorthHistory, Budget
+    init_db, get_session, seed_default_categories, to_cents, from_cents,
+    Account, BalanceHistory, PlaidItem, Holding,
+    Transaction, NetWorthHistory, Budget
 )
 from services import (
     AccountService, BalanceService, TransactionService,
-    HoldingService, NetWorthService, BudgetService
+    HoldingService, NetWorthService, BudgetService,
+    discretionary_map, invalidate_discretionary_map, normalize_category
 )
 from plaid_service import plaid_service
 
@@ -25,123 +37,266 @@ from plaid_service import plaid_service
 engine = init_db(settings.DATABASE_PATH)
 
 def get_db():
-    session = get_session(engine)
-    try:
+    # One transaction per request: service helpers flush but never
+    # commit, so all writes from a handler land in a single COMMIT here.
+    # On handler error the yield raises, the commit is skipped, and the
+    # context manager rolls back. The factory is configured with
+    # expire_on_commit=False so committed objects stay readable without
+    # re-SELECTing their attributes
+    with get_session() as session:
         yield session
-    finally:
-        session.close()
+        session.commit()
+
+
+# Cache for read-only endpoints - the data they serve only changes on
+# sync (daily by default), so dashboard polling doesn't need to hit the DB
+_response_cache = TTLCache(maxsize=256, ttl=60)
+
+
+def invalidate_response_cache():
+    _response_cache.clear()
+
+
+def cached_response(handler):
+    """Cache an endpoint's payload keyed on its name and query params"""
+    @functools.wraps(handler)
+    async def wrapper(*args, **kwargs):
+        key = (handler.__name__,) + tuple(
+            sorted((k, v) for k, v in kwargs.items() if k != "session")
+        )
+        try:
+            return _response_cache[key]
+        except KeyError:
+            pass
+        result = await handler(*args, **kwargs)
+        _response_cache[key] = result
+        return result
+    return wrapper
 
 
 # Scheduled job for daily refresh
-def daily_refresh_job():
+async def daily_refresh_job():
     """Refresh all accounts daily"""
-    session = get_session(engine)
+    await refresh_all_items()
+
+
+async def refresh_all_items():
+    """Sync every active Plaid item concurrently, then refresh derived data"""
+    session = get_session()
     try:
         items = session.query(PlaidItem).filter_by(status="active").all()
-        for item in items:
-            try:
-                sync_item_data(session, item)
-            except Exception as e:
-                print(f"Error syncing item {item.id}: {e}")
+    finally:
+        session.close()
 
-        # Record net worth snapshot
-        NetWorthService.record_net_worth_snapshot(session)
+    async def sync_one(item: PlaidItem):
+        # One session per task - SQLAlchemy sessions are not safe to share
+        # across concurrent coroutines
+        task_session = get_session()
+        try:
+            return await sync_item_data(task_session, task_session.merge(item))
+        finally:
+            task_session.close()
+
+    results = await asyncio.gather(
+        *(sync_one(item) for item in items), return_exceptions=True
+    )
+    changed_account_ids = set()
+    for item, result in zip(items, results):
+        if isinstance(result, Exception):
+            # A failed item rolled back, so it changed no balances
+            print(f"Error syncing item {item.id}: {result}")
+        else:
+            changed_account_ids.update(result or ())
+
+    session = get_session()
+    try:
+        # Record net worth snapshot incrementally from this sync's deltas
+        NetWorthService.record_net_worth_snapshot(
+            session, changed_account_ids=changed_account_ids
+        )
 
         # Recalculate frivolous spending
         today = date.today()
         TransactionService.calculate_frivolous_spending(session, today.year, today.month)
+        session.commit()
     finally:
         session.close()
 
+    invalidate_response_cache()
 
-def sync_item_data(session, item: PlaidItem):
-    """Sync all data for a Plaid item"""
-    # Get accounts and balances
-    accounts_data = plaid_service.get_accounts(item.access_token)
-
-    for acc in accounts_data["accounts"]:
-        account = AccountService.create_or_update_account(
-            session,
-            plaid_account_id=acc["account_id"],
-            plaid_item_id=item.plaid_item_id,
-            institution_name=item.institution_name,
-            name=acc["name"],
-            account_type=acc["type"],
-            official_name=acc["official_name"],
-            mask=acc["mask"],
-        )
 
-        # Record balance
-        BalanceService.record_balance(
-            session,
-            account_id=account.id,
-            current_balance=acc["balances"]["current"] or 0,
-            available_balance=acc["balances"]["available"],
-            credit_limit=acc["balances"]["limit"],
-        )
+async def sync_item_data(session, item: PlaidItem):
+    """Sync all data for a Plaid item"""
+    # Transactions stream in per page - each page also carries accounts
+    # and balances, saving a separate accounts_get round trip. The
+    # generator prefetches page k+1 while page k is persisted here.
+    # Plaid SDK calls block, so pull pages off-loop.
+    pages = plaid_service.sync_transactions(item.access_token, cursor=item.cursor)
+
+    # The holdings call is independent of the transaction stream; start
+    # it now so the two Plaid round-trips overlap and the wall clock is
+    # the max of the two instead of the sum
+    async def fetch_holdings():
+        try:
+            return await asyncio.to_thread(
+                plaid_service.get_investment_holdings, item.access_token
+            )
+        except Exception:
+            return None  # Not all accounts have investments
+
+    holdings_task = asyncio.ensure_future(fetch_holdings())
+
+    category_map = discretionary_map(session)
+    acct_map = {}
+    accounts_processed = False
+    cursor = item.cursor
+    changed_account_ids = set()
+
+    page = await asyncio.to_thread(next, pages, None)
+    while page is not None:
+        if not accounts_processed:
+            accounts = page.get("accounts") or []
+            if not accounts:
+                # Cold start fallback
+                accounts_data = await asyncio.to_thread(
+                    plaid_service.get_accounts, item.access_token
+                )
+                accounts = accounts_data["accounts"]
+
+            for acc in accounts:
+                account_id = AccountService.create_or_update_account(
+                    session,
+                    plaid_account_id=acc["account_id"],
+                    plaid_item_id=item.plaid_item_id,
+                    institution_name=item.institution_name,
+                    name=acc["name"],
+                    account_type=acc["type"],
+                    official_name=acc["official_name"],
+                    mask=acc["mask"],
+                )
+
+                # Record balance
+                changed_account_ids.add(BalanceService.record_balance(
+                    session,
+                    account_id=account_id,
+                    current_balance=acc["balances"]["current"] or 0,
+                    available_balance=acc["balances"]["available"],
+                    credit_limit=acc["balances"]["limit"],
+                ))
+
+            # One item-scoped lookup covers every page's transactions
+            # (and the holdings below), instead of a query per page
+            acct_map = dict(
+                session.query(Account.plaid_account_id, Account.id)
+                .filter(Account.plaid_item_id == item.plaid_item_id).all()
+            )
+            accounts_processed = True
 
-    # Sync transactions
-    txn_data = plaid_service.sync_transactions(item.access_token)
-    for txn in txn_data["transactions"]:
-        account = session.query(Account).filter_by(
-            plaid_account_id=txn["account_id"]
-        ).first()
-        if account:
+        rows = []
+        for txn in page["transactions"]:
+            account_id = acct_map.get(txn["account_id"])
+            if account_id is None:
+                continue
             pfc = txn.get("personal_finance_category") or {}
-            TransactionService.create_or_update_transaction(
-                session,
-                account_id=account.id,
-                plaid_transaction_id=txn["transaction_id"],
-                txn_date=date.fromisoformat(txn["date"]),
-                amount=txn["amount"],
-                merchant_name=txn["merchant_name"],
-                description=txn["name"],
-                category_primary=pfc.get("primary"),
-                category_detailed=pfc.get("detailed"),
-                pending=txn["pending"],
+            primary = pfc.get("primary")
+            rows.append({
+                "account_id": account_id,
+                "plaid_transaction_id": txn["transaction_id"],
+                "date": date.fromisoformat(txn["date"]),
+                "amount": to_cents(txn["amount"]),
+                "merchant_name": txn["merchant_name"],
+                "description": txn["name"],
+                "plaid_category_primary": primary,
+                "plaid_category_detailed": pfc.get("detailed"),
+                "pending": txn["pending"],
+                "is_discretionary": category_map.get(normalize_category(primary), False),
+            })
+
+        if rows:
+            stmt = sqlite_insert(Transaction).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["plaid_transaction_id"],
+                set_={
+                    "amount": stmt.excluded.amount,
+                    "merchant_name": stmt.excluded.merchant_name,
+                    "description": stmt.excluded.description,
+                    "pending": stmt.excluded.pending,
+                    "is_discretionary": stmt.excluded.is_discretionary,
+                    "updated_at": datetime.utcnow(),
+                },
             )
+            session.execute(stmt)
 
-    # Sync investments if available
-    try:
-        holdings_data = plaid_service.get_investment_holdings(item.access_token)
+        cursor = page.get("cursor") or cursor
+        page = await asyncio.to_thread(next, pages, None)
+
+    # Sync investments if available (fetched concurrently above)
+    holdings_data = await holdings_task
+
+    # Persist holdings, batched per account
+    if holdings_data:
+        holdings_by_account = {}
         for holding in holdings_data["holdings"]:
-            account = session.query(Account).filter_by(
-                plaid_account_id=holding["account_id"]
-            ).first()
-            if account:
-                HoldingService.update_holdings(session, account.id, [holding])
-    except Exception:
-        pass  # Not all accounts have investments
-
-    # Update last sync time
+            account_id = acct_map.get(holding["account_id"])
+            if account_id is not None:
+                holdings_by_account.setdefault(account_id, []).append(holding)
+        for account_id, account_holdings in holdings_by_account.items():
+            HoldingService.update_holdings(session, account_id, account_holdings)
+
+    # Persist the cursor so the next refresh only pulls the delta
+    item.cursor = cursor
     item.last_successful_sync = datetime.utcnow()
     session.commit()
+    return changed_account_ids
+
 
+# Lock file that elects a single scheduler owner when running with
+# multiple workers (uvicorn --workers N would otherwise fire the daily
+# refresh N times)
+SCHEDULER_LOCK_FILE = "/tmp/networth_scheduler.lock"
 
-# Scheduler setup
-scheduler = BackgroundScheduler()
+
+def _acquire_scheduler_lock():
+    """Return the lock file handle if this worker should run the scheduler"""
+    lock_file = open(SCHEDULER_LOCK_FILE, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return lock_file
+    except OSError:
+        lock_file.close()
+        return None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    session = get_session(engine)
+    session = get_session()
     seed_default_categories(session)
     session.close()
-
-    # Schedule daily refresh
-    scheduler.add_job(
-        daily_refresh_job,
-        'cron',
-        hour=settings.DAILY_REFRESH_HOUR,
-        minute=settings.DAILY_REFRESH_MINUTE
-    )
-    scheduler.start()
+    invalidate_discretionary_map()
+
+    # Schedule daily refresh on the running event loop - async jobs share
+    # the loop (and connection pool) with request handlers instead of a
+    # separate thread pool. Only the worker holding the lock starts it.
+    scheduler = None
+    scheduler_lock = _acquire_scheduler_lock()
+    if scheduler_lock:
+        scheduler = AsyncIOScheduler()
+        scheduler.add_job(
+            daily_refresh_job,
+            'cron',
+            hour=settings.DAILY_REFRESH_HOUR,
+            minute=settings.DAILY_REFRESH_MINUTE
+        )
+        scheduler.start()
 
     yield
 
     # Shutdown
-    scheduler.shutdown()
+    if scheduler:
+        scheduler.shutdown()
+    if scheduler_lock:
+        scheduler_lock.close()
 
 
 # FastAPI app
@@ -149,7 +304,8 @@ app = FastAPI(
     title="NetWorth Calculator API",
     description="Personal finance tracking with Plaid integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for React frontend
@@ -249,9 +405,13 @@ async def exchange_public_token(request: PublicTokenRequest, session=Depends(get
         session.add(item)
         session.commit()
 
-        # Initial sync
-        sync_item_data(session, item)
+        # Initial sync. Full snapshot recompute: the incremental path is
+        # only sound when the caller synced every item (as the daily
+        # refresh does) - a one-item delta here would overwrite changes
+        # already folded into today's snapshot.
+        await sync_item_data(session, item)
         NetWorthService.record_net_worth_snapshot(session)
+        invalidate_response_cache()
 
         return {"success": True, "item_id": result["item_id"]}
     except Exception as e:
@@ -260,53 +420,68 @@ async def exchange_public_token(request: PublicTokenRequest, session=Depends(get
 
 # ============== ACCOUNT ENDPOINTS ==============
 
-@app.get("/api/accounts", response_model=List[AccountResponse])
+@app.get("/api/accounts")
 async def get_accounts(session=Depends(get_db)):
     """Get all linked accounts with current balances"""
-    accounts = AccountService.get_all_accounts(session)
-    result = []
-
-    for acc in accounts:
-        balance = session.query(BalanceService).filter_by(
-            account_id=acc.id
-        ).order_by(BalanceService.date.desc()).first() if hasattr(BalanceService, 'query') else None
-
-        # Get latest balance differently
-        from models import BalanceHistory
-        balance = session.query(BalanceHistory).filter_by(
-            account_id=acc.id
-        ).order_by(BalanceHistory.date.desc()).first()
-
-        result.append(AccountResponse(
-            id=acc.id,
-            institution_name=acc.institution_name,
-            name=acc.name,
-            account_type=acc.account_type.value,
-            mask=acc.mask,
-            current_balance=balance.current_balance if balance else None,
-        ))
+    # Latest balance per account in a single round trip instead of one
+    # ORDER BY ... LIMIT 1 query per account
+    latest = session.query(
+        BalanceHistory.account_id,
+        func.max(BalanceHistory.date).label("d"),
+    ).group_by(BalanceHistory.account_id).subquery()
+
+    rows = session.query(Account, BalanceHistory).outerjoin(
+        latest, latest.c.account_id == Account.id
+    ).outerjoin(
+        BalanceHistory,
+        and_(
+            BalanceHistory.account_id == latest.c.account_id,
+            BalanceHistory.date == latest.c.d,
+        ),
+    ).filter(Account.is_active.is_(True)).all()
 
-    return result
+    return [
+        {
+            "id": acc.id,
+            "institution_name": acc.institution_name,
+            "name": acc.name,
+            "account_type": acc.account_type,
+            "mask": acc.mask,
+            "current_balance": from_cents(balance.current_balance) if balance else None,
+        }
+        for acc, balance in rows
+    ]
 
 
 # ============== NET WORTH ENDPOINTS ==============
 
 @app.get("/api/net-worth/current", response_model=NetWorthResponse)
+@cached_response
 async def get_current_net_worth(session=Depends(get_db)):
     """Get current net worth breakdown"""
-    return NetWorthService.calculate_net_worth(session)
+    data = NetWorthService.calculate_net_worth(session)
+    return {
+        "date": data["date"],
+        "total_cash": from_cents(data["total_cash"]),
+        "total_investments": from_cents(data["total_investments"]),
+        "total_assets": from_cents(data["total_assets"]),
+        "total_credit_card_debt": from_cents(data["total_credit_card_debt"]),
+        "total_liabilities": from_cents(data["total_liabilities"]),
+        "net_worth": from_cents(data["net_worth"]),
+    }
 
 
 @app.get("/api/net-worth/history")
+@cached_response
 async def get_net_worth_history(days: int = 30, session=Depends(get_db)):
     """Get net worth history for charting"""
     history = NetWorthService.get_net_worth_history(session, days)
     return [
         {
             "date": h.date.isoformat(),
-            "net_worth": h.net_worth,
-            "total_assets": h.total_assets,
-            "total_liabilities": h.total_liabilities,
+            "net_worth": from_cents(h.net_worth),
+            "total_assets": from_cents(h.total_assets),
+            "total_liabilities": from_cents(h.total_liabilities),
         }
         for h in history
     ]
@@ -314,29 +489,44 @@ async def get_net_worth_history(days: int = 30, session=Depends(get_db)):
 
 # ============== HOLDINGS ENDPOINTS ==============
 
-@app.get("/api/holdings", response_model=List[HoldingResponse])
+@app.get("/api/holdings")
+@cached_response
 async def get_holdings(session=Depends(get_db)):
     """Get all investment holdings"""
-    holdings = session.query(Holding).all()
-    result = []
+    rows = session.query(
+        Holding.symbol, Holding.name, Holding.quantity,
+        Holding.cost_basis, Holding.current_price, Holding.current_value,
+    ).all()
+
+    # Vectorize the gain/loss math over contiguous float arrays; missing
+    # cost basis / value becomes NaN and maps back to None below
+    cost_basis = np.fromiter(
+        (r.cost_basis if r.cost_basis else np.nan for r in rows),
+        dtype=np.float64, count=len(rows),
+    )
+    current_value = np.fromiter(
+        (r.current_value if r.current_value else np.nan for r in rows),
+        dtype=np.float64, count=len(rows),
+    )
+    gain_loss = current_value - cost_basis
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gain_loss_percent = np.where(
+            cost_basis > 0, gain_loss / cost_basis * 100.0, 0.0
+        )
 
-    for h in holdings:
-        gain_loss = None
-        gain_loss_percent = None
-        if h.cost_basis and h.current_value:
-            gain_loss = h.current_value - h.cost_basis
-            gain_loss_percent = (gain_loss / h.cost_basis) * 100 if h.cost_basis > 0 else 0
-
-        result.append(HoldingResponse(
-            symbol=h.symbol,
-            name=h.name,
-            quantity=h.quantity,
-            cost_basis=h.cost_basis,
-            current_price=h.current_price,
-            current_value=h.current_value,
-            gain_loss=gain_loss,
-            gain_loss_percent=gain_loss_percent,
-        ))
+    result = []
+    for i, r in enumerate(rows):
+        has_gain = not np.isnan(gain_loss[i])
+        result.append({
+            "symbol": r.symbol,
+            "name": r.name,
+            "quantity": r.quantity,
+            "cost_basis": from_cents(r.cost_basis),
+            "current_price": from_cents(r.current_price),
+            "current_value": from_cents(r.current_value),
+            "gain_loss": float(gain_loss[i]) / 100 if has_gain else None,
+            "gain_loss_percent": float(gain_loss_percent[i]) if has_gain else None,
+        })
 
     return result
 
@@ -356,32 +546,37 @@ async def get_transactions(
     year = year or today.year
     month = month or today.month
 
-    transactions = TransactionService.get_transactions_for_month(session, year, month)
-
-    if category:
-        transactions = [t for t in transactions if t.plaid_category_primary == category]
-
-    if frivolous_only:
-        transactions = [t for t in transactions if t.is_frivolous]
+    query = TransactionService.month_query(
+        session, year, month, category=category, frivolous_only=frivolous_only
+    )
 
-    return [
-        {
-            "id": t.id,
-            "date": t.date.isoformat(),
-            "amount": t.amount,
-            "merchant_name": t.merchant_name,
-            "description": t.description,
-            "category": t.plaid_category_primary,
-            "category_detailed": t.plaid_category_detailed,
-            "is_discretionary": t.is_discretionary,
-            "is_frivolous": t.is_frivolous,
-            "pending": t.pending,
-        }
-        for t in transactions
-    ]
+    # Stream the JSON array in 500-row chunks - memory stays constant for
+    # arbitrarily large months and the frontend can start rendering early
+    def generate():
+        yield b"["
+        first = True
+        for t in query.yield_per(500):
+            prefix = b"" if first else b","
+            first = False
+            yield prefix + orjson.dumps({
+                "id": t.id,
+                "date": t.date.isoformat(),
+                "amount": from_cents(t.amount),
+                "merchant_name": t.merchant_name,
+                "description": t.description,
+                "category": t.plaid_category_primary,
+                "category_detailed": t.plaid_category_detailed,
+                "is_discretionary": t.is_discretionary,
+                "is_frivolous": t.is_frivolous,
+                "pending": t.pending,
+            })
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @app.get("/api/spending/by-category")
+@cached_response
 async def get_spending_by_category(
     year: Optional[int] = None,
     month: Optional[int] = None,
@@ -392,28 +587,30 @@ async def get_spending_by_category(
     year = year or today.year
     month = month or today.month
 
-    transactions = TransactionService.get_transactions_for_month(session, year, month)
-
-    categories = {}
-    for t in transactions:
-        if t.amount > 0:  # Only outgoing
-            cat = t.plaid_category_primary or "Uncategorized"
-            if cat not in categories:
-                categories[cat] = {
-                    "category": cat,
-                    "total": 0,
-                    "necessary": 0,
-                    "frivolous": 0,
-                    "count": 0,
-                }
-            categories[cat]["total"] += t.amount
-            categories[cat]["count"] += 1
-            if t.is_frivolous:
-                categories[cat]["frivolous"] += t.amount
-            else:
-                categories[cat]["necessary"] += t.amount
-
-    return sorted(categories.values(), key=lambda x: x["total"], reverse=True)
+    # Aggregate in SQL - one GROUP BY instead of materializing every
+    # transaction row in Python
+    rows = session.query(
+        func.coalesce(Transaction.plaid_category_primary, "Uncategorized").label("category"),
+        func.sum(Transaction.amount).label("total"),
+        func.sum(case((Transaction.is_frivolous, Transaction.amount), else_=0)).label("frivolous"),
+        func.sum(case((~Transaction.is_frivolous, Transaction.amount), else_=0)).label("necessary"),
+        func.count().label("count"),
+    ).filter(
+        Transaction.amount > 0,  # Only outgoing
+        extract("year", Transaction.date) == year,
+        extract("month", Transaction.date) == month,
+    ).group_by("category").order_by(desc("total")).all()
+
+    return [
+        {
+            "category": r.category,
+            "total": from_cents(r.total),
+            "necessary": from_cents(r.necessary),
+            "frivolous": from_cents(r.frivolous),
+            "count": r.count,
+        }
+        for r in rows
+    ]
 
 
 # ============== BUDGET ENDPOINTS ==============
@@ -422,16 +619,18 @@ async def get_spending_by_category(
 async def set_budget(request: BudgetRequest, session=Depends(get_db)):
     """Set a main or category budget"""
     if request.is_main:
-        budget = BudgetService.set_main_budget(session, request.monthly_limit)
+        budget_id = BudgetService.set_main_budget(session, request.monthly_limit)
     else:
         if not request.category:
             raise HTTPException(status_code=400, detail="Category required for category budgets")
-        budget = BudgetService.set_category_budget(session, request.category, request.monthly_limit)
+        budget_id = BudgetService.set_category_budget(session, request.category, request.monthly_limit)
 
-    return {"success": True, "budget_id": budget.id}
+    invalidate_response_cache()
+    return {"success": True, "budget_id": budget_id}
 
 
 @app.get("/api/budgets")
+@cached_response
 async def get_budgets(session=Depends(get_db)):
     """Get all budgets"""
     budgets = BudgetService.get_all_budgets(session)
@@ -439,7 +638,7 @@ async def get_budgets(session=Depends(get_db)):
         {
             "id": b.id,
             "category": b.category,
-            "monthly_limit": b.monthly_limit,
+            "monthly_limit": from_cents(b.monthly_limit),
             "is_main": b.is_main_budget,
         }
         for b in budgets
@@ -463,18 +662,10 @@ async def get_budget_status(
 # ============== SYNC ENDPOINTS ==============
 
 @app.post("/api/sync")
-async def manual_sync(session=Depends(get_db)):
+async def manual_sync():
     """Manually trigger a sync of all accounts"""
     try:
-        items = session.query(PlaidItem).filter_by(status="active").all()
-        for item in items:
-            sync_item_data(session, item)
-
-        NetWorthService.record_net_worth_snapshot(session)
-
-        today = date.today()
-        TransactionService.calculate_frivolous_spending(session, today.year, today.month)
-
+        await refresh_all_items()
         return {"success": True, "message": "Sync completed"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
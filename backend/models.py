@@ -1,30 +1,52 @@
 # Database models for NetWorthCalculator
 # Using SQLite with SQLAlchemy ORM
 
-from datetime import datetime, date
 from typing import Optional
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, Boolean,
-    Date, DateTime, ForeignKey, Enum as SQLEnum
+    create_engine, event, func, CheckConstraint, Column, Integer, String,
+    Float, Boolean, Date, DateTime, ForeignKey, Index, UniqueConstraint
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
-import enum
+from sqlalchemy.schema import CreateIndex
 
 Base = declarative_base()
 
 
-class AccountType(enum.Enum):
-    CHECKING = "checking"
-    SAVINGS = "savings"
-    CREDIT_CARD = "credit_card"
-    BROKERAGE = "brokerage"
-    RETIREMENT = "retirement"  # 401k, IRA, etc.
+# Account types stored as plain strings - reading an Enum column forces
+# SQLAlchemy to materialize an enum object per row on hot queries.
+# "retirement" covers 401k, IRA, etc.
+ACCOUNT_TYPES = frozenset({
+    "checking", "savings", "credit_card", "brokerage", "retirement"
+})
+
+
+# Monetary columns store integer cents: SUM() stays exact, SQLite uses
+# the cheaper INTEGER storage class, and serialization avoids float
+# formatting. Convert with these helpers at the Plaid/API boundaries.
+def to_cents(dollars) -> Optional[int]:
+    """Dollars (Plaid/API input) -> integer cents for storage"""
+    if dollars is None:
+        return None
+    return int(round(dollars * 100))
+
+
+def from_cents(cents) -> Optional[float]:
+    """Stored integer cents -> dollars for API responses"""
+    if cents is None:
+        return None
+    return cents / 100
 
 
 class Account(Base):
     """Linked financial accounts from Plaid"""
     __tablename__ = "accounts"
+    __table_args__ = (
+        CheckConstraint(
+            "account_type IN ('checking','savings','credit_card','brokerage','retirement')",
+            name="ck_account_type",
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     plaid_account_id = Column(String, unique=True, nullable=False)
@@ -32,11 +54,11 @@ class Account(Base):
     institution_name = Column(String, nullable=False)  # "Chase", "PNC", "Robinhood"
     name = Column(String, nullable=False)  # "Checking Account", "Brokerage"
     official_name = Column(String)  # Full official name from bank
-    account_type = Column(SQLEnum(AccountType), nullable=False)
+    account_type = Column(String(16), nullable=False, index=True)
     mask = Column(String)  # Last 4 digits: "1234"
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
+    updated_at = Column(DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     # Relationships
     balances = relationship("BalanceHistory", back_populates="account")
@@ -47,14 +69,19 @@ class Account(Base):
 class BalanceHistory(Base):
     """Daily balance snapshots for historical tracking"""
     __tablename__ = "balance_history"
+    __table_args__ = (
+        # Unique: one snapshot per account per day, and the upsert
+        # target for record_balance (the index also serves lookups)
+        UniqueConstraint("account_id", "date", name="uq_bh_acct_date"),
+    )
 
     id = Column(Integer, primary_key=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
     date = Column(Date, nullable=False)
-    current_balance = Column(Float, nullable=False)  # Current balance
-    available_balance = Column(Float)  # Available (for credit: available credit)
-    credit_limit = Column(Float)  # For credit cards only
-    created_at = Column(DateTime, default=datetime.utcnow)
+    current_balance = Column(Integer, nullable=False)  # Current balance, in cents
+    available_balance = Column(Integer)  # Available (for credit: available credit), in cents
+    credit_limit = Column(Integer)  # For credit cards only, in cents
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
     # Relationships
     account = relationship("Account", back_populates="balances")
@@ -63,19 +90,23 @@ class BalanceHistory(Base):
 class Holding(Base):
     """Investment positions (stocks, ETFs, etc.)"""
     __tablename__ = "holdings"
+    __table_args__ = (
+        # Upsert target for update_holdings
+        UniqueConstraint("account_id", "plaid_security_id", name="uq_holding_acct_security"),
+    )
 
     id = Column(Integer, primary_key=True)
-    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
     plaid_security_id = Column(String)
     symbol = Column(String, nullable=False)  # "AAPL", "VOO"
     name = Column(String)  # "Apple Inc.", "Vanguard S&P 500 ETF"
     quantity = Column(Float, nullable=False)
-    cost_basis = Column(Float)  # Total cost basis
-    current_price = Column(Float)
-    current_value = Column(Float)
+    cost_basis = Column(Integer)  # Total cost basis, in cents
+    current_price = Column(Integer)  # Cents
+    current_value = Column(Integer)  # Cents
     iso_currency_code = Column(String, default="USD")
     as_of_date = Column(Date, nullable=False)  # When this snapshot was taken
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
     # Relationships
     account = relationship("Account", back_populates="holdings")
@@ -86,18 +117,24 @@ class HoldingHistory(Base):
     __tablename__ = "holding_history"
 
     id = Column(Integer, primary_key=True)
-    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
     symbol = Column(String, nullable=False)
     quantity = Column(Float, nullable=False)
-    current_price = Column(Float)
-    current_value = Column(Float)
+    current_price = Column(Integer)  # Cents
+    current_value = Column(Integer)  # Cents
     date = Column(Date, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
 
 class Transaction(Base):
     """All transactions (spending, income, transfers)"""
     __tablename__ = "transactions"
+    __table_args__ = (
+        # (date, id) matches the month queries' ORDER BY, so SQLite can
+        # return rows pre-sorted straight off the index
+        Index("ix_txn_date_id", "date", "id"),
+        Index("ix_txn_acct_date", "account_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
@@ -105,7 +142,7 @@ class Transaction(Base):
 
     # Transaction details
     date = Column(Date, nullable=False)
-    amount = Column(Float, nullable=False)  # Positive = money out, Negative = money in (Plaid convention)
+    amount = Column(Integer, nullable=False)  # Cents; positive = money out, negative = money in (Plaid convention)
     merchant_name = Column(String)
     description = Column(String)  # Original transaction name
 
@@ -123,8 +160,8 @@ class Transaction(Base):
 
     # Metadata
     pending = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
+    updated_at = Column(DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     # Relationships
     account = relationship("Account", back_populates="transactions")
@@ -133,14 +170,18 @@ class Transaction(Base):
 class Budget(Base):
     """Monthly budgets - main and per-category"""
     __tablename__ = "budgets"
+    __table_args__ = (
+        # Upsert target for the set_*_budget helpers
+        UniqueConstraint("category", "is_main_budget", name="uq_budget_category_main"),
+    )
 
     id = Column(Integer, primary_key=True)
     category = Column(String, nullable=False)  # "MAIN" for overall, or category name
-    monthly_limit = Column(Float, nullable=False)
+    monthly_limit = Column(Integer, nullable=False)  # Cents
     is_main_budget = Column(Boolean, default=False)  # True for the main overall budget
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
+    updated_at = Column(DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
 
 class CategoryConfig(Base):
@@ -151,7 +192,7 @@ class CategoryConfig(Base):
     plaid_category = Column(String, unique=True, nullable=False)  # Plaid category name
     display_name = Column(String)  # Friendly name for UI
     is_discretionary = Column(Boolean, default=False)  # True = can be frivolous
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
 
 class NetWorthHistory(Base):
@@ -161,19 +202,19 @@ class NetWorthHistory(Base):
     id = Column(Integer, primary_key=True)
     date = Column(Date, unique=True, nullable=False)
 
-    # Assets
-    total_cash = Column(Float, default=0)  # Checking + Savings
-    total_investments = Column(Float, default=0)  # Brokerage + Retirement
-    total_assets = Column(Float, default=0)
+    # Assets (all in cents)
+    total_cash = Column(Integer, default=0)  # Checking + Savings
+    total_investments = Column(Integer, default=0)  # Brokerage + Retirement
+    total_assets = Column(Integer, default=0)
 
-    # Liabilities
-    total_credit_card_debt = Column(Float, default=0)
-    total_liabilities = Column(Float, default=0)
+    # Liabilities (cents)
+    total_credit_card_debt = Column(Integer, default=0)
+    total_liabilities = Column(Integer, default=0)
 
-    # Net worth
-    net_worth = Column(Float, default=0)
+    # Net worth (cents)
+    net_worth = Column(Integer, default=0)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
 
 class PlaidItem(Base):
@@ -185,24 +226,166 @@ class PlaidItem(Base):
     access_token = Column(String, nullable=False)  # Encrypted in production
     institution_id = Column(String)
     institution_name = Column(String)
-    status = Column(String, default="active")  # active, needs_reauth, error
+    status = Column(String, default="active", index=True)  # active, needs_reauth, error
+    # transactions/sync cursor - passing it back makes each refresh an
+    # incremental delta instead of a full history re-download
+    cursor = Column(String, nullable=True)
     last_successful_sync = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
+    updated_at = Column(DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
 
 # Database initialization
+
+# Session factory - built once by init_db, reused for every session
+SessionLocal = None
+
+# In-place upgrades for databases created by older revisions.
+# create_all never alters existing tables, so schema changes that touch
+# pre-existing data are applied here; PRAGMA user_version records the
+# applied revision so non-idempotent steps run exactly once.
+SCHEMA_VERSION = 1
+
+# Monetary columns that stored dollar floats before the integer-cents
+# conversion
+_CENTS_COLUMNS = {
+    "balance_history": ("current_balance", "available_balance", "credit_limit"),
+    "holdings": ("cost_basis", "current_price", "current_value"),
+    "holding_history": ("current_price", "current_value"),
+    "transactions": ("amount",),
+    "budgets": ("monthly_limit",),
+    "net_worth_history": (
+        "total_cash", "total_investments", "total_assets",
+        "total_credit_card_debt", "total_liabilities", "net_worth",
+    ),
+}
+
+
+def _declared_type(conn, table: str, column: str) -> Optional[str]:
+    for row in conn.exec_driver_sql(f"PRAGMA table_info({table})"):
+        if row[1] == column:
+            return (row[2] or "").upper()
+    return None
+
+
+def _migrate_legacy_db(conn):
+    """Upgrade an existing database to the current schema in place"""
+    # Monetary columns used to store dollar floats; rewrite them as
+    # integer cents. The declared-type guard skips databases that were
+    # created storing cents already (their columns say INTEGER).
+    if _declared_type(conn, "transactions", "amount") == "FLOAT":
+        for table, columns in _CENTS_COLUMNS.items():
+            assignments = ", ".join(
+                f"{c} = CAST(ROUND({c} * 100) AS INTEGER)" for c in columns
+            )
+            conn.exec_driver_sql(f"UPDATE {table} SET {assignments}")
+
+    # The old Enum column stored member names ("CHECKING"); the string
+    # column stores the lowercase values the bucket map expects
+    conn.exec_driver_sql("UPDATE accounts SET account_type = lower(account_type)")
+
+    # Columns added after the table first shipped
+    if _declared_type(conn, "plaid_items", "cursor") is None:
+        conn.exec_driver_sql("ALTER TABLE plaid_items ADD COLUMN cursor TEXT")
+
+    # Unique indexes the ON CONFLICT upserts target. Existing tables
+    # keep their original CREATE TABLE, so these arrive as standalone
+    # indexes (equivalent to the table-level constraints on fresh DBs).
+    # Duplicates are removed first, keeping the newest row.
+    conn.exec_driver_sql(
+        "DELETE FROM balance_history WHERE id NOT IN"
+        " (SELECT MAX(id) FROM balance_history GROUP BY account_id, date)"
+    )
+    conn.exec_driver_sql(
+        "DELETE FROM budgets WHERE id NOT IN"
+        " (SELECT MAX(id) FROM budgets GROUP BY category, is_main_budget)"
+    )
+    conn.exec_driver_sql(
+        "DELETE FROM holdings WHERE plaid_security_id IS NOT NULL AND id NOT IN"
+        " (SELECT MAX(id) FROM holdings WHERE plaid_security_id IS NOT NULL"
+        "  GROUP BY account_id, plaid_security_id)"
+    )
+    conn.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_bh_acct_date"
+        " ON balance_history (account_id, date)"
+    )
+    conn.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_budget_category_main"
+        " ON budgets (category, is_main_budget)"
+    )
+    conn.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_holding_acct_security"
+        " ON holdings (account_id, plaid_security_id)"
+    )
+
+    # Performance indexes declared on the models - create_all skips
+    # tables that already exist, so build whatever is missing here
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+# WAL allows readers to proceed while a sync is writing, and
+# synchronous=NORMAL halves fsync cost per commit. Requires the DB
+# file's directory to be writable (WAL sidecar files).
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
 def init_db(db_path: str = "networth.db"):
     """Initialize the database and create all tables"""
-    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    global SessionLocal
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        pool_use_lifo=True,  # Reuse hot connections for better cache locality
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    # Distinguish a brand-new database (stamped as current, nothing to
+    # migrate) from one created by an earlier revision
+    with engine.connect() as conn:
+        existed = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='accounts'"
+        ).fetchone() is not None
+
     Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        if version < SCHEMA_VERSION:
+            if existed:
+                _migrate_legacy_db(conn)
+            conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     return engine
 
 
-def get_session(engine):
-    """Create a database session"""
-    Session = sessionmaker(bind=engine)
-    return Session()
+def get_session(engine=None):
+    """Create a database session from the shared factory.
+
+    The engine argument is accepted for backwards compatibility; the
+    factory is already bound to the engine built by init_db.
+    """
+    return SessionLocal()
 
 
 # Default category configurations
@@ -253,24 +436,16 @@ DEFAULT_ESSENTIAL_CATEGORIES = [
 
 def seed_default_categories(session):
     """Seed the database with default category configurations"""
-    existing = session.query(CategoryConfig).first()
+    existing = session.query(CategoryConfig.id).limit(1).scalar()
     if existing:
         return  # Already seeded
 
-    for cat in DEFAULT_DISCRETIONARY_CATEGORIES:
-        config = CategoryConfig(
-            plaid_category=cat,
-            display_name=cat,
-            is_discretionary=True
-        )
-        session.add(config)
-
-    for cat in DEFAULT_ESSENTIAL_CATEGORIES:
-        config = CategoryConfig(
-            plaid_category=cat,
-            display_name=cat,
-            is_discretionary=False
-        )
-        session.add(config)
-
+    rows = [
+        {"plaid_category": cat, "display_name": cat, "is_discretionary": True}
+        for cat in DEFAULT_DISCRETIONARY_CATEGORIES
+    ] + [
+        {"plaid_category": cat, "display_name": cat, "is_discretionary": False}
+        for cat in DEFAULT_ESSENTIAL_CATEGORIES
+    ]
+    session.bulk_insert_mappings(CategoryConfig, rows)
     session.commit()
@@ -1,20 +1,26 @@
 # Plaid API integration service
 
 import plaid
+import urllib3
+from urllib3.util.retry import Retry
 from plaid.api import plaid_api
 from plaid.model.link_token_create_request import LinkTokenCreateRequest
 from plaid.model.link_token_create_request_user import LinkTokenCreateRequestUser
 from plaid.model.item_public_token_exchange_request import ItemPublicTokenExchangeRequest
 from plaid.model.accounts_get_request import AccountsGetRequest
 from plaid.model.transactions_sync_request import TransactionsSyncRequest
+from plaid.model.transactions_sync_request_options import TransactionsSyncRequestOptions
 from plaid.model.investments_holdings_get_request import InvestmentsHoldingsGetRequest
 from plaid.model.investments_transactions_get_request import InvestmentsTransactionsGetRequest
 from plaid.model.products import Products
 from plaid.model.country_code import CountryCode
 
+from cachetools import TTLCache
+
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Optional
-from config import settings, PLAID_ENV_URLS
+from config import settings, PLAID_BASE_URL
 
 
 class PlaidService:
@@ -23,34 +29,68 @@ class PlaidService:
     def __init__(self):
         # Configure Plaid client
         configuration = plaid.Configuration(
-            host=PLAID_ENV_URLS[settings.PLAID_ENV],
+            host=PLAID_BASE_URL,
             api_key={
                 "clientId": settings.PLAID_CLIENT_ID,
                 "secret": settings.PLAID_SECRET,
             }
         )
+        configuration.connection_pool_maxsize = 16
         api_client = plaid.ApiClient(configuration)
+
+        # Keep-alive connection pool: back-to-back Plaid calls reuse warm
+        # TCP+TLS connections instead of handshaking per request, with
+        # bounded retries on transient gateway/rate-limit errors
+        api_client.rest_client.pool_manager = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=16,
+            block=False,
+            retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
         self.client = plaid_api.PlaidApi(api_client)
 
+        # Link tokens stay valid for ~4 hours; cache them per user so
+        # repeated frontend mounts reuse the token instead of paying a
+        # Plaid round trip each time
+        self._link_token_cache = TTLCache(maxsize=64, ttl=3 * 3600)
+
+        # Settings never change at runtime; build the SDK enum lists
+        # once instead of per link-token request
+        self._products = [Products(p) for p in settings.PLAID_PRODUCTS]
+        self._country_codes = [
+            CountryCode(c) for c in settings.PLAID_COUNTRY_CODES
+        ]
+
+        # Security metadata (ticker, name, close price) is near-static;
+        # cache it by security_id for a day so repeat holdings calls
+        # don't re-parse hundreds of SDK model objects
+        self._security_cache = TTLCache(maxsize=10_000, ttl=86400)
+
     def create_link_token(self, user_id: str = "user-1") -> dict:
         """
         Create a Link token for initializing Plaid Link in the frontend.
         This is the first step to connect a new bank account.
         """
-        products = []
-        for product in settings.PLAID_PRODUCTS:
-            products.append(Products(product))
+        cached = self._link_token_cache.get(user_id)
+        if cached:
+            return cached
 
         request = LinkTokenCreateRequest(
             user=LinkTokenCreateRequestUser(client_user_id=user_id),
             client_name="NetWorth Calculator",
-            products=products,
-            country_codes=[CountryCode("US")],
+            products=self._products,
+            country_codes=self._country_codes,
             language="en",
         )
 
         response = self.client.link_token_create(request)
-        return {"link_token": response.link_token}
+        result = {"link_token": response.link_token}
+        self._link_token_cache[user_id] = result
+        return result
 
     def exchange_public_token(self, public_token: str) -> dict:
         """
@@ -65,27 +105,33 @@ class PlaidService:
             "item_id": response.item_id,
         }
 
+    @staticmethod
+    def _format_account(account) -> dict:
+        return {
+            "account_id": account.account_id,
+            "name": account.name,
+            "official_name": account.official_name,
+            "type": account.type.value,
+            "subtype": account.subtype.value if account.subtype else None,
+            "mask": account.mask,
+            "balances": {
+                "current": account.balances.current,
+                "available": account.balances.available,
+                "limit": account.balances.limit,
+                "currency": account.balances.iso_currency_code,
+            }
+        }
+
     def get_accounts(self, access_token: str) -> dict:
-        """Get all accounts associated with an access token"""
+        """Get all accounts associated with an access token.
+
+        Kept as a fallback for cold starts - regular refreshes read the
+        accounts included in the transactions/sync response instead.
+        """
         request = AccountsGetRequest(access_token=access_token)
         response = self.client.accounts_get(request)
 
-        accounts = []
-        for account in response.accounts:
-            accounts.append({
-                "account_id": account.account_id,
-                "name": account.name,
-                "official_name": account.official_name,
-                "type": account.type.value,
-                "subtype": account.subtype.value if account.subtype else None,
-                "mask": account.mask,
-                "balances": {
-                    "current": account.balances.current,
-                    "available": account.balances.available,
-                    "limit": account.balances.limit,
-                    "currency": account.balances.iso_currency_code,
-                }
-            })
+        accounts = [self._format_account(account) for account in response.accounts]
 
         return {
             "accounts": accounts,
@@ -95,65 +141,79 @@ class PlaidService:
             }
         }
 
-    def sync_transactions(self, access_token: str, cursor: Optional[str] = None) -> dict:
+    def _sync_page(self, access_token: str, cursor: str):
+        """Fetch a single transactions/sync page"""
+        request = TransactionsSyncRequest(
+            access_token=access_token,
+            cursor=cursor,
+            options=TransactionsSyncRequestOptions(
+                include_personal_finance_category=True,
+            ),
+        )
+        return self.client.transactions_sync(request)
+
+    @staticmethod
+    def _format_transaction(txn) -> dict:
+        return {
+            "transaction_id": txn.transaction_id,
+            "account_id": txn.account_id,
+            "date": txn.date.isoformat() if isinstance(txn.date, date) else txn.date,
+            "amount": txn.amount,
+            "merchant_name": txn.merchant_name,
+            "name": txn.name,
+            "category": txn.category,  # List like ["Food and Drink", "Restaurants"]
+            "category_id": txn.category_id,
+            "pending": txn.pending,
+            "personal_finance_category": {
+                "primary": txn.personal_finance_category.primary if txn.personal_finance_category else None,
+                "detailed": txn.personal_finance_category.detailed if txn.personal_finance_category else None,
+            } if txn.personal_finance_category else None,
+        }
+
+    def sync_transactions(self, access_token: str, cursor: Optional[str] = None):
         """
         Sync transactions using Plaid's transactions/sync endpoint.
         This is more efficient than the older transactions/get endpoint.
+
+        Generator: yields one dict per page so the caller can persist
+        each page while the next one is already being fetched in a
+        background worker, instead of buffering the whole history.
         """
-        all_added = []
-        all_modified = []
-        all_removed = []
-        has_more = True
-        next_cursor = cursor
-
-        while has_more:
-            request = TransactionsSyncRequest(
-                access_token=access_token,
-                cursor=next_cursor if next_cursor else "",
-            )
-            response = self.client.transactions_sync(request)
-
-            all_added.extend(response.added)
-            all_modified.extend(response.modified)
-            all_removed.extend(response.removed)
-
-            has_more = response.has_more
-            next_cursor = response.next_cursor
-
-        # Format transactions
-        transactions = []
-        for txn in all_added + all_modified:
-            transactions.append({
-                "transaction_id": txn.transaction_id,
-                "account_id": txn.account_id,
-                "date": txn.date.isoformat() if isinstance(txn.date, date) else txn.date,
-                "amount": txn.amount,
-                "merchant_name": txn.merchant_name,
-                "name": txn.name,
-                "category": txn.category,  # List like ["Food and Drink", "Restaurants"]
-                "category_id": txn.category_id,
-                "pending": txn.pending,
-                "personal_finance_category": {
-                    "primary": txn.personal_finance_category.primary if txn.personal_finance_category else None,
-                    "detailed": txn.personal_finance_category.detailed if txn.personal_finance_category else None,
-                } if txn.personal_finance_category else None,
-            })
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(self._sync_page, access_token, cursor or "")
+            while future is not None:
+                response = future.result()
+                # Prefetch the next page while this one is formatted
+                # and persisted by the consumer
+                if response.has_more:
+                    future = pool.submit(
+                        self._sync_page, access_token, response.next_cursor
+                    )
+                else:
+                    future = None
 
-        return {
-            "transactions": transactions,
-            "removed": [r.transaction_id for r in all_removed],
-            "cursor": next_cursor,
-        }
+                yield {
+                    "transactions": [
+                        self._format_transaction(txn)
+                        for txn in list(response.added) + list(response.modified)
+                    ],
+                    "removed": [r.transaction_id for r in response.removed],
+                    "cursor": response.next_cursor,
+                    # Plaid returns accounts (with balances) on every
+                    # page, saving callers a separate accounts_get
+                    "accounts": [self._format_account(a) for a in response.accounts],
+                }
 
     def get_investment_holdings(self, access_token: str) -> dict:
         """Get current investment holdings"""
         request = InvestmentsHoldingsGetRequest(access_token=access_token)
         response = self.client.investments_holdings_get(request)
 
-        # Build security lookup
-        securities = {}
+        # Refresh the shared cache from whatever this response carries,
+        # then read through it - securities already cached (and not
+        # re-sent) still resolve
         for security in response.securities:
-            securities[security.security_id] = {
+            self._security_cache[security.security_id] = {
                 "symbol": security.ticker_symbol,
                 "name": security.name,
                 "type": security.type,
@@ -162,7 +222,7 @@ class PlaidService:
 
         holdings = []
         for holding in response.holdings:
-            security = securities.get(holding.security_id, {})
+            security = self._security_cache.get(holding.security_id, {})
             holdings.append({
                 "account_id": holding.account_id,
                 "security_id": holding.security_id,
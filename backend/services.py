@@ -1,17 +1,93 @@
 # Business logic services for NetWorthCalculator
 
+import re
 from datetime import datetime, date, timedelta
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, insert, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from models import (
-    Account, AccountType, BalanceHistory, Holding, HoldingHistory,
+    Account, BalanceHistory, Holding, HoldingHistory,
     Transaction, Budget, CategoryConfig, NetWorthHistory, PlaidItem,
-    seed_default_categories
+    seed_default_categories, to_cents, from_cents
 )
 
 
+# Plaid PFC primaries use underscores ("FOOD_AND_DRINK") where the
+# seeded config uses spaces; the old ILIKE matched them because "_" is
+# a single-char LIKE wildcard
+_CATEGORY_SEPARATORS = re.compile(r"[_\s]+")
+
+
+def normalize_category(name) -> str:
+    """Canonical form for category comparisons (exact match, no scans).
+
+    Collapses underscores/whitespace to single spaces and lowercases,
+    so every pairing the old unindexable ILIKE '%...%' query matched
+    still matches after normalization.
+    """
+    return _CATEGORY_SEPARATORS.sub(" ", name or "").strip().lower()
+
+
+# Cached {normalized plaid_category: is_discretionary} map. Category
+# config only changes at seeding time, so classification during a sync
+# can be a dict lookup instead of a query per transaction.
+_discretionary_map = None
+
+
+def discretionary_map(session: Session) -> dict:
+    global _discretionary_map
+    if _discretionary_map is None:
+        _discretionary_map = {
+            normalize_category(category): is_discretionary
+            for category, is_discretionary in session.query(
+                CategoryConfig.plaid_category, CategoryConfig.is_discretionary
+            ).all()
+        }
+    return _discretionary_map
+
+
+def invalidate_discretionary_map():
+    """Call after any CategoryConfig write"""
+    global _discretionary_map
+    _discretionary_map = None
+
+
+# Account type -> net worth bucket, built once instead of re-creating
+# membership lists on every loop iteration
+_BUCKET = {
+    "checking": "cash",
+    "savings": "cash",
+    "brokerage": "inv",
+    "retirement": "inv",
+    "credit_card": "debt",
+}
+
+
+# Plaid account type/subtype -> our account_type, keys pre-lowercased.
+# Built once at import instead of per create_or_update_account call
+_ACCOUNT_TYPE_MAP = {
+    "depository": "checking",
+    "checking": "checking",
+    "savings": "savings",
+    "credit": "credit_card",
+    "investment": "brokerage",
+    "brokerage": "brokerage",
+    "retirement": "retirement",
+}
+
+
+def month_bounds(year: int, month: int):
+    """Half-open [start, end) date range for a calendar month"""
+    start = date(year, month, 1)
+    if month == 12:
+        end = date(year + 1, 1, 1)
+    else:
+        end = date(year, month + 1, 1)
+    return start, end
+
+
 class AccountService:
     """Service for managing accounts"""
 
@@ -25,39 +101,31 @@ class AccountService:
         account_type: str,
         official_name: str = None,
         mask: str = None
-    ) -> Account:
-        """Create or update an account from Plaid data"""
-        type_mapping = {
-            "depository": AccountType.CHECKING,
-            "checking": AccountType.CHECKING,
-            "savings": AccountType.SAVINGS,
-            "credit": AccountType.CREDIT_CARD,
-            "investment": AccountType.BROKERAGE,
-            "brokerage": AccountType.BROKERAGE,
-            "retirement": AccountType.RETIREMENT,
-        }
-
-        account = session.query(Account).filter_by(plaid_account_id=plaid_account_id).first()
-
-        if not account:
-            account = Account(
-                plaid_account_id=plaid_account_id,
-                plaid_item_id=plaid_item_id,
-                institution_name=institution_name,
-                name=name,
-                official_name=official_name,
-                account_type=type_mapping.get(account_type.lower(), AccountType.CHECKING),
-                mask=mask,
-            )
-            session.add(account)
-        else:
-            account.name = name
-            account.official_name = official_name
-            account.institution_name = institution_name
-            account.updated_at = datetime.utcnow()
-
-        session.commit()
-        return account
+    ) -> int:
+        """Upsert an account from Plaid data; returns the account id.
+
+        One INSERT ... ON CONFLICT statement instead of query-then-
+        update. Does not commit - the caller owns the transaction.
+        """
+        stmt = sqlite_insert(Account).values(
+            plaid_account_id=plaid_account_id,
+            plaid_item_id=plaid_item_id,
+            institution_name=institution_name,
+            name=name,
+            official_name=official_name,
+            account_type=_ACCOUNT_TYPE_MAP.get(account_type.lower(), "checking"),
+            mask=mask,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["plaid_account_id"],
+            set_={
+                "name": stmt.excluded.name,
+                "official_name": stmt.excluded.official_name,
+                "institution_name": stmt.excluded.institution_name,
+                "updated_at": datetime.utcnow(),
+            },
+        ).returning(Account.id)
+        return session.execute(stmt).scalar_one()
 
     @staticmethod
     def get_all_accounts(session: Session) -> List[Account]:
@@ -75,34 +143,33 @@ class BalanceService:
         available_balance: float = None,
         credit_limit: float = None,
         for_date: date = None
-    ) -> BalanceHistory:
+    ) -> int:
+        """Upsert the day's balance row; returns the account id.
+
+        Single INSERT ... ON CONFLICT on (account_id, date).
+        Does not commit.
+        """
         if for_date is None:
             for_date = date.today()
 
-        existing = session.query(BalanceHistory).filter(
-            and_(
-                BalanceHistory.account_id == account_id,
-                BalanceHistory.date == for_date
-            )
-        ).first()
-
-        if existing:
-            existing.current_balance = current_balance
-            existing.available_balance = available_balance
-            existing.credit_limit = credit_limit
-            balance = existing
-        else:
-            balance = BalanceHistory(
-                account_id=account_id,
-                date=for_date,
-                current_balance=current_balance,
-                available_balance=available_balance,
-                credit_limit=credit_limit,
-            )
-            session.add(balance)
-
-        session.commit()
-        return balance
+        stmt = sqlite_insert(BalanceHistory).values(
+            account_id=account_id,
+            date=for_date,
+            # Balances arrive as dollars from Plaid; stored as integer cents
+            current_balance=to_cents(current_balance),
+            available_balance=to_cents(available_balance),
+            credit_limit=to_cents(credit_limit),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["account_id", "date"],
+            set_={
+                "current_balance": stmt.excluded.current_balance,
+                "available_balance": stmt.excluded.available_balance,
+                "credit_limit": stmt.excluded.credit_limit,
+            },
+        )
+        session.execute(stmt)
+        return account_id
 
 
 class TransactionService:
@@ -120,19 +187,21 @@ class TransactionService:
         category_primary: str = None,
         category_detailed: str = None,
         category_id: str = None,
-        pending: bool = False
+        pending: bool = False,
+        category_map: dict = None,
     ) -> Transaction:
+        """Upsert one transaction. Does not commit."""
+        amount = to_cents(amount)
+
         txn = session.query(Transaction).filter_by(
             plaid_transaction_id=plaid_transaction_id
         ).first()
 
-        is_discretionary = False
-        if category_primary:
-            cat_config = session.query(CategoryConfig).filter(
-                CategoryConfig.plaid_category.ilike(f"%{category_primary}%")
-            ).first()
-            if cat_config:
-                is_discretionary = cat_config.is_discretionary
+        # Callers persisting many transactions pass the memoized map so
+        # the category_config table isn't queried once per row
+        if category_map is None:
+            category_map = discretionary_map(session)
+        is_discretionary = category_map.get(normalize_category(category_primary), False)
 
         if not txn:
             txn = Transaction(
@@ -157,61 +226,106 @@ class TransactionService:
             txn.is_discretionary = is_discretionary
             txn.updated_at = datetime.utcnow()
 
-        session.commit()
+        session.flush()
         return txn
 
     @staticmethod
-    def get_transactions_for_month(session: Session, year: int, month: int) -> List[Transaction]:
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1)
-        else:
-            end_date = date(year, month + 1, 1)
-
-        return session.query(Transaction).filter(
+    def month_query(
+        session: Session,
+        year: int,
+        month: int,
+        category: str = None,
+        frivolous_only: bool = False
+    ):
+        """Build the query for a month's transactions with optional filters
+        applied in SQL, so unwanted rows are never hydrated."""
+        start_date, end_date = month_bounds(year, month)
+
+        query = session.query(Transaction).filter(
             and_(
                 Transaction.date >= start_date,
                 Transaction.date < end_date
             )
-        ).order_by(Transaction.date).all()
+        )
+        if category:
+            query = query.filter(Transaction.plaid_category_primary == category)
+        if frivolous_only:
+            query = query.filter(Transaction.is_frivolous.is_(True))
+        # id tiebreaker gives a stable order (and matches ix_txn_date_id),
+        # so consumers never need to re-sort in Python
+        return query.order_by(Transaction.date, Transaction.id)
+
+    @staticmethod
+    def get_transactions_for_month(
+        session: Session,
+        year: int,
+        month: int,
+        category: str = None,
+        frivolous_only: bool = False
+    ) -> List[Transaction]:
+        return TransactionService.month_query(
+            session, year, month, category=category, frivolous_only=frivolous_only
+        ).all()
 
     @staticmethod
     def calculate_frivolous_spending(session: Session, year: int, month: int):
         """Calculate which transactions are frivolous based on budget rules."""
-        transactions = TransactionService.get_transactions_for_month(session, year, month)
+        start_date, end_date = month_bounds(year, month)
+
+        # Core tuple rows: this path only reads five columns per
+        # transaction, so skip ORM hydration entirely
+        rows = session.execute(
+            select(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.plaid_category_primary,
+                Transaction.is_discretionary,
+                Transaction.is_frivolous,
+            )
+            .where(Transaction.date >= start_date, Transaction.date < end_date)
+            .order_by(Transaction.date, Transaction.id)
+        ).all()
 
-        main_budget = session.query(Budget).filter_by(is_main_budget=True, is_active=True).first()
-        category_budgets = {
-            b.category: b.monthly_limit
-            for b in session.query(Budget).filter_by(is_main_budget=False, is_active=True).all()
-        }
+        main_limit = session.execute(
+            select(Budget.monthly_limit).where(
+                Budget.is_main_budget.is_(True), Budget.is_active.is_(True)
+            )
+        ).scalar()
+        category_budgets = dict(session.execute(
+            select(Budget.category, Budget.monthly_limit).where(
+                Budget.is_main_budget.is_(False), Budget.is_active.is_(True)
+            )
+        ).all())
 
-        main_spending = 0.0
+        main_spending = 0  # cents
         category_spending = {}
+        changed = []
 
-        sorted_txns = sorted(transactions, key=lambda t: (t.date, t.id))
-
-        for txn in sorted_txns:
-            if txn.amount <= 0:
+        for txn_id, amount, category_primary, is_discretionary, was_frivolous in rows:
+            if amount <= 0:
                 continue
 
-            category = txn.plaid_category_primary or "Uncategorized"
+            category = category_primary or "Uncategorized"
 
-            main_spending += txn.amount
-            category_spending[category] = category_spending.get(category, 0) + txn.amount
+            main_spending += amount
+            category_spending[category] = category_spending.get(category, 0) + amount
 
             is_frivolous = False
-            if txn.is_discretionary:
+            if is_discretionary:
                 if category in category_budgets:
                     if category_spending[category] > category_budgets[category]:
                         is_frivolous = True
 
-                if main_budget and main_spending > main_budget.monthly_limit:
+                if main_limit is not None and main_spending > main_limit:
                     is_frivolous = True
 
-            txn.is_frivolous = is_frivolous
+            if was_frivolous != is_frivolous:
+                changed.append({"id": txn_id, "is_frivolous": is_frivolous})
 
-        session.commit()
+        # One bulk UPDATE for only the rows whose flag actually flipped,
+        # instead of dirtying every ORM instance in the unit of work
+        if changed:
+            session.bulk_update_mappings(Transaction, changed)
 
 
 class HoldingService:
@@ -219,39 +333,70 @@ class HoldingService:
 
     @staticmethod
     def update_holdings(session: Session, account_id: int, holdings_data: List[dict]):
-        today = date.today()
+        """Replace an account's holdings snapshot. Does not commit.
 
-        session.query(Holding).filter_by(account_id=account_id).delete()
+        Upserts in place rather than delete-then-reinsert, so existing
+        rows keep their ids and a mid-run failure can't leave the
+        account with no holdings at all.
+        """
+        today = date.today()
 
+        # Drop positions the institution no longer reports. Rows without
+        # a security id can't participate in the upsert (SQLite treats
+        # NULLs as distinct in unique indexes), so they are cleared and
+        # re-inserted fresh.
+        keep = [h["security_id"] for h in holdings_data if h.get("security_id")]
+        session.query(Holding).filter(
+            Holding.account_id == account_id,
+            or_(
+                Holding.plaid_security_id.is_(None),
+                Holding.plaid_security_id.notin_(keep),
+            ),
+        ).delete(synchronize_session=False)
+
+        holding_rows = []
+        history_rows = []
         for h in holdings_data:
             # Handle None symbols (e.g., cash holdings)
             symbol = h.get("symbol") or h.get("name") or "CASH"
 
-            holding = Holding(
-                account_id=account_id,
-                plaid_security_id=h.get("security_id"),
-                symbol=symbol,
-                name=h.get("name"),
-                quantity=h.get("quantity", 0),
-                cost_basis=h.get("cost_basis"),
-                current_price=h.get("current_price"),
-                current_value=h.get("current_value"),
-                iso_currency_code=h.get("currency", "USD"),
-                as_of_date=today,
+            current_price = to_cents(h.get("current_price"))
+            current_value = to_cents(h.get("current_value"))
+
+            holding_rows.append({
+                "account_id": account_id,
+                "plaid_security_id": h.get("security_id"),
+                "symbol": symbol,
+                "name": h.get("name"),
+                "quantity": h.get("quantity", 0),
+                "cost_basis": to_cents(h.get("cost_basis")),
+                "current_price": current_price,
+                "current_value": current_value,
+                "iso_currency_code": h.get("currency", "USD"),
+                "as_of_date": today,
+            })
+            history_rows.append({
+                "account_id": account_id,
+                "symbol": symbol,
+                "quantity": h.get("quantity", 0),
+                "current_price": current_price,
+                "current_value": current_value,
+                "date": today,
+            })
+
+        if holding_rows:
+            stmt = sqlite_insert(Holding).values(holding_rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["account_id", "plaid_security_id"],
+                set_={c: stmt.excluded[c] for c in (
+                    "symbol", "name", "quantity", "cost_basis",
+                    "current_price", "current_value", "iso_currency_code",
+                    "as_of_date",
+                )},
             )
-            session.add(holding)
-
-            history = HoldingHistory(
-                account_id=account_id,
-                symbol=symbol,
-                quantity=h.get("quantity", 0),
-                current_price=h.get("current_price"),
-                current_value=h.get("current_value"),
-                date=today,
-            )
-            session.add(history)
-
-        session.commit()
+            session.execute(stmt)
+            # History is append-only: one multi-row INSERT
+            session.execute(insert(HoldingHistory), history_rows)
 
 
 class NetWorthService:
@@ -262,31 +407,43 @@ class NetWorthService:
         if for_date is None:
             for_date = date.today()
 
-        accounts = session.query(Account).filter_by(is_active=True).all()
-
-        total_cash = 0.0
-        total_investments = 0.0
-        total_credit_debt = 0.0
-
-        for account in accounts:
-            balance = session.query(BalanceHistory).filter(
-                BalanceHistory.account_id == account.id
-            ).order_by(BalanceHistory.date.desc()).first()
-
-            if not balance:
-                continue
-
-            if account.account_type in [AccountType.CHECKING, AccountType.SAVINGS]:
-                total_cash += balance.current_balance
-            elif account.account_type in [AccountType.BROKERAGE, AccountType.RETIREMENT]:
-                total_investments += balance.current_balance
-            elif account.account_type == AccountType.CREDIT_CARD:
-                total_credit_debt += balance.current_balance
-
+        # Single query: a MAX(date)-per-account subquery joined back to
+        # balance_history picks each account's latest balance, so we pull
+        # one narrow row per account instead of every balance snapshot
+        latest = (
+            session.query(
+                BalanceHistory.account_id,
+                func.max(BalanceHistory.date).label("max_date"),
+            )
+            .group_by(BalanceHistory.account_id)
+            .subquery()
+        )
+        rows = (
+            session.query(Account.account_type, BalanceHistory.current_balance)
+            .join(latest, latest.c.account_id == Account.id)
+            .join(BalanceHistory, and_(
+                BalanceHistory.account_id == latest.c.account_id,
+                BalanceHistory.date == latest.c.max_date,
+            ))
+            .filter(Account.is_active.is_(True))
+            .all()
+        )
+
+        # All sums in integer cents - exact, no float accumulation error
+        totals = {"cash": 0, "inv": 0, "debt": 0}
+        for account_type, current_balance in rows:
+            bucket = _BUCKET.get(account_type)
+            if bucket:
+                totals[bucket] += current_balance
+
+        total_cash = totals["cash"]
+        total_investments = totals["inv"]
+        total_credit_debt = totals["debt"]
         total_assets = total_cash + total_investments
         total_liabilities = total_credit_debt
         net_worth = total_assets - total_liabilities
 
+        # Monetary values in cents; convert at the response boundary
         return {
             "date": for_date.isoformat(),
             "total_cash": total_cash,
@@ -298,36 +455,115 @@ class NetWorthService:
         }
 
     @staticmethod
-    def record_net_worth_snapshot(session: Session, for_date: date = None):
+    def record_net_worth_snapshot(
+        session: Session,
+        for_date: date = None,
+        changed_account_ids=None,
+    ) -> dict:
+        """Upsert the day's net worth snapshot (one statement, keyed on
+        the unique date column); returns the computed totals in cents.
+        Does not commit.
+
+        When the caller knows which accounts a sync touched, pass their
+        ids and the snapshot is derived from the previous one plus the
+        per-account balance deltas - O(changed accounts) instead of
+        rescanning every account. Falls back to a full recompute when
+        there is no prior snapshot to build on.
+        """
         if for_date is None:
             for_date = date.today()
 
-        data = NetWorthService.calculate_net_worth(session, for_date)
-
-        existing = session.query(NetWorthHistory).filter_by(date=for_date).first()
-
-        if existing:
-            existing.total_cash = data["total_cash"]
-            existing.total_investments = data["total_investments"]
-            existing.total_assets = data["total_assets"]
-            existing.total_credit_card_debt = data["total_credit_card_debt"]
-            existing.total_liabilities = data["total_liabilities"]
-            existing.net_worth = data["net_worth"]
-            snapshot = existing
-        else:
-            snapshot = NetWorthHistory(
-                date=for_date,
-                total_cash=data["total_cash"],
-                total_investments=data["total_investments"],
-                total_assets=data["total_assets"],
-                total_credit_card_debt=data["total_credit_card_debt"],
-                total_liabilities=data["total_liabilities"],
-                net_worth=data["net_worth"],
+        data = None
+        if changed_account_ids is not None:
+            data = NetWorthService._incremental_totals(
+                session, for_date, changed_account_ids
             )
-            session.add(snapshot)
+        if data is None:
+            data = NetWorthService.calculate_net_worth(session, for_date)
+
+        fields = (
+            "total_cash", "total_investments", "total_assets",
+            "total_credit_card_debt", "total_liabilities", "net_worth",
+        )
+        stmt = sqlite_insert(NetWorthHistory).values(
+            date=for_date, **{f: data[f] for f in fields}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["date"],
+            set_={f: stmt.excluded[f] for f in fields},
+        )
+        session.execute(stmt)
+        return data
 
-        session.commit()
-        return snapshot
+    @staticmethod
+    def _incremental_totals(session: Session, for_date: date, changed_account_ids) -> Optional[dict]:
+        """Previous snapshot plus balance deltas for the changed accounts.
+
+        Returns None when no earlier snapshot exists (first run), in
+        which case the caller does a full recompute.
+        """
+        baseline = session.execute(
+            select(NetWorthHistory)
+            .where(NetWorthHistory.date < for_date)
+            .order_by(NetWorthHistory.date.desc())
+            .limit(1)
+        ).scalar()
+        if baseline is None:
+            return None
+
+        totals = {
+            "cash": baseline.total_cash,
+            "inv": baseline.total_investments,
+            "debt": baseline.total_credit_card_debt,
+        }
+
+        ids = list(changed_account_ids)
+        if ids:
+            def bucket_sums(before: date = None) -> dict:
+                # Latest balance per changed account, optionally as of
+                # before the snapshot date (the "old" side of the delta)
+                q = session.query(
+                    BalanceHistory.account_id,
+                    func.max(BalanceHistory.date).label("max_date"),
+                ).filter(BalanceHistory.account_id.in_(ids))
+                if before is not None:
+                    q = q.filter(BalanceHistory.date < before)
+                else:
+                    q = q.filter(BalanceHistory.date <= for_date)
+                sub = q.group_by(BalanceHistory.account_id).subquery()
+
+                rows = (
+                    session.query(Account.account_type, BalanceHistory.current_balance)
+                    .join(sub, sub.c.account_id == Account.id)
+                    .join(BalanceHistory, and_(
+                        BalanceHistory.account_id == sub.c.account_id,
+                        BalanceHistory.date == sub.c.max_date,
+                    ))
+                    .filter(Account.is_active.is_(True))
+                    .all()
+                )
+                sums = {"cash": 0, "inv": 0, "debt": 0}
+                for account_type, current_balance in rows:
+                    bucket = _BUCKET.get(account_type)
+                    if bucket:
+                        sums[bucket] += current_balance
+                return sums
+
+            new_sums = bucket_sums()
+            old_sums = bucket_sums(before=for_date)
+            for bucket in totals:
+                totals[bucket] += new_sums[bucket] - old_sums[bucket]
+
+        total_assets = totals["cash"] + totals["inv"]
+        return {
+            "date": for_date.isoformat(),
+            "total_cash": totals["cash"],
+            "total_investments": totals["inv"],
+            "total_assets": total_assets,
+            "total_credit_card_debt": totals["debt"],
+            "total_liabilities": totals["debt"],
+            "net_worth": total_assets - totals["debt"],
+        }
 
     @staticmethod
     def get_net_worth_history(session: Session, days: int = 30) -> List[NetWorthHistory]:
@@ -341,43 +577,30 @@ class BudgetService:
     """Service for managing budgets"""
 
     @staticmethod
-    def set_main_budget(session: Session, monthly_limit: float) -> Budget:
-        budget = session.query(Budget).filter_by(is_main_budget=True).first()
+    def set_main_budget(session: Session, monthly_limit: float) -> int:
+        """Upsert the main budget; returns the budget id. Does not commit."""
+        return BudgetService._upsert_budget(session, "MAIN", monthly_limit, True)
 
-        if budget:
-            budget.monthly_limit = monthly_limit
-            budget.updated_at = datetime.utcnow()
-        else:
-            budget = Budget(
-                category="MAIN",
-                monthly_limit=monthly_limit,
-                is_main_budget=True,
-            )
-            session.add(budget)
-
-        session.commit()
-        return budget
+    @staticmethod
+    def set_category_budget(session: Session, category: str, monthly_limit: float) -> int:
+        """Upsert a category budget; returns the budget id. Does not commit."""
+        return BudgetService._upsert_budget(session, category, monthly_limit, False)
 
     @staticmethod
-    def set_category_budget(session: Session, category: str, monthly_limit: float) -> Budget:
-        budget = session.query(Budget).filter_by(
+    def _upsert_budget(session: Session, category: str, monthly_limit: float, is_main: bool) -> int:
+        stmt = sqlite_insert(Budget).values(
             category=category,
-            is_main_budget=False
-        ).first()
-
-        if budget:
-            budget.monthly_limit = monthly_limit
-            budget.updated_at = datetime.utcnow()
-        else:
-            budget = Budget(
-                category=category,
-                monthly_limit=monthly_limit,
-                is_main_budget=False,
-            )
-            session.add(budget)
-
-        session.commit()
-        return budget
+            monthly_limit=to_cents(monthly_limit),
+            is_main_budget=is_main,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["category", "is_main_budget"],
+            set_={
+                "monthly_limit": stmt.excluded.monthly_limit,
+                "updated_at": datetime.utcnow(),
+            },
+        ).returning(Budget.id)
+        return session.execute(stmt).scalar_one()
 
     @staticmethod
     def get_all_budgets(session: Session) -> List[Budget]:
@@ -386,38 +609,45 @@ class BudgetService:
     @staticmethod
     def get_budget_status(session: Session, year: int, month: int) -> dict:
         budgets = BudgetService.get_all_budgets(session)
-        transactions = TransactionService.get_transactions_for_month(session, year, month)
-
-        category_spending = {}
-        total_spending = 0.0
-
-        for txn in transactions:
-            if txn.amount > 0:
-                category = txn.plaid_category_primary or "Uncategorized"
-                category_spending[category] = category_spending.get(category, 0) + txn.amount
-                total_spending += txn.amount
+        start_date, end_date = month_bounds(year, month)
+
+        # Aggregate in SQL: one row per category crosses the wire
+        # instead of one per transaction
+        category_col = func.coalesce(
+            Transaction.plaid_category_primary, "Uncategorized"
+        )
+        category_spending = dict(session.execute(
+            select(category_col, func.sum(Transaction.amount))
+            .where(
+                Transaction.date >= start_date,
+                Transaction.date < end_date,
+                Transaction.amount > 0,
+            )
+            .group_by(category_col)
+        ).all())
+        total_spending = sum(category_spending.values())  # cents
 
         status = {
             "main_budget": None,
             "category_budgets": [],
-            "total_spending": total_spending,
+            "total_spending": from_cents(total_spending),
         }
 
         for budget in budgets:
             if budget.is_main_budget:
                 status["main_budget"] = {
-                    "limit": budget.monthly_limit,
-                    "spent": total_spending,
-                    "remaining": budget.monthly_limit - total_spending,
+                    "limit": from_cents(budget.monthly_limit),
+                    "spent": from_cents(total_spending),
+                    "remaining": from_cents(budget.monthly_limit - total_spending),
                     "percentage": (total_spending / budget.monthly_limit * 100) if budget.monthly_limit > 0 else 0,
                 }
             else:
                 spent = category_spending.get(budget.category, 0)
                 status["category_budgets"].append({
                     "category": budget.category,
-                    "limit": budget.monthly_limit,
-                    "spent": spent,
-                    "remaining": budget.monthly_limit - spent,
+                    "limit": from_cents(budget.monthly_limit),
+                    "spent": from_cents(spent),
+                    "remaining": from_cents(budget.monthly_limit - spent),
                     "percentage": (spent / budget.monthly_limit * 100) if budget.monthly_limit > 0 else 0,
                 })
 